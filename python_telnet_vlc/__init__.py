@@ -1,3 +1,4 @@
 #!/usr/bin/python3
 
 from python_telnet_vlc.vlctelnet import *
+from python_telnet_vlc.asyncvlctelnet import AsyncVLCTelnet
@@ -0,0 +1,229 @@
+# Asyncio version of the library for contacting VLC through telnet.
+
+# Imports
+import asyncio
+import logging
+import socket
+
+from python_telnet_vlc.vlctelnet import (
+    _IAC_SEQUENCE, _check_output, _check_password_response, _parse_info, _parse_int, _parse_status,
+    ConnectionError,
+)
+
+_LOGGER = logging.getLogger(__package__)
+
+
+# Async VLC Telnet Class
+class AsyncVLCTelnet(object):
+    """Asyncio connection to VLC using Telnet.
+       Await connect() and login() before running commands. Commands not
+       wrapped here can be sent with run_command()."""
+
+    # Non commands
+    def __init__(self, host="localhost", password="admin", port=4212, timeout=10, retries=1):
+        self.reader = None
+        self.writer = None
+        self.host = host
+        self.port = port
+        self.password = password
+        self.timeout = timeout
+        self.retries = retries
+        # Created on first use, inside the running event loop (Python < 3.10 binds it at creation).
+        self._lock = None
+
+    async def connect(self):
+        """Connect to VLC."""
+        try:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port, limit=2 ** 20), self.timeout)
+        except (OSError, asyncio.TimeoutError):
+            raise ConnectionError("Could not connect to VLC. Make sure the Telnet interface is enabled and accessible.")
+        # Commands are tiny, don't let Nagle hold them back.
+        sock = self.writer.get_extra_info('socket')
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    async def _open(self):
+        """Connect and login. Disconnects again if either fails, so no half opened
+           connection is left behind."""
+        try:
+            await self.connect()
+            await self.login()
+        except asyncio.TimeoutError:
+            await self.disconnect()
+            raise ConnectionError("Timed out waiting for VLC.")
+        except (OSError, EOFError):
+            await self.disconnect()
+            raise ConnectionError("Lost connection to VLC.")
+        except BaseException:
+            await self.disconnect()
+            raise
+
+    async def disconnect(self):
+        """Disconnect from VLC."""
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                # Already broken, nothing left to close cleanly.
+                pass
+        # reset the instance
+        self.reader = None
+        self.writer = None
+
+    async def _read_until(self, delim):
+        """Read until delim is found and return everything up to and including it.
+           If VLC closes the connection first, return what was received, or raise EOFError if nothing."""
+        try:
+            return await asyncio.wait_for(self.reader.readuntil(delim), self.timeout)
+        except asyncio.IncompleteReadError as error:
+            # VLC closed the connection after a last output, like on logout.
+            if error.partial:
+                return error.partial
+            raise
+
+    async def login(self):
+        """Login with password."""
+        full_command = (self.password + '\n').encode('utf-8')
+        # Send the password without waiting for the prompt, saving a round trip.
+        self.writer.write(full_command)
+        await self._read_until(b"Password: ")
+        for _ in range(2):
+            command_output = _IAC_SEQUENCE.sub(b'', await self._read_until(b'\n')).decode('utf-8').strip('\r\n')
+            if command_output:  # discard empty line once.
+                break
+        _LOGGER.debug("Password response: %s", command_output)
+        _check_password_response(command_output)
+        if "> " in command_output:
+            return
+        # Read until prompt
+        await self._read_until(b'> ')
+
+    async def run_command(self, command):
+        """Run a command and return a list with the output lines.
+           Connects if needed, and reconnects and retries up to self.retries times
+           if the connection was lost. A timeout is not retried, as the command
+           may already have run."""
+        full_command = (command + '\n').encode('utf-8')
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        # One command at a time, so concurrent callers don't mix up outputs.
+        async with self._lock:
+            for attempt in range(self.retries + 1):
+                if self.writer is None:
+                    await self._open()
+                try:
+                    _LOGGER.debug("Sending command: %s", command)
+                    self.writer.write(full_command)
+                    command_output = (await self._read_until(b'> ')).split(b'\r\n')[:-1]
+                    break
+                except asyncio.TimeoutError:
+                    # Drop the connection so the late output can't be read by the next command.
+                    await self.disconnect()
+                    raise ConnectionError("Timed out waiting for VLC.")
+                except (OSError, EOFError):
+                    await self.disconnect()
+                    if attempt == self.retries:
+                        raise ConnectionError("Lost connection to VLC.")
+                    _LOGGER.debug("Connection lost, reconnecting to VLC")
+                except BaseException:
+                    # Cancelled halfway, the output is still pending on the connection.
+                    await self.disconnect()
+                    raise
+        _LOGGER.debug("Command output: %s", command_output)
+        _check_output(command_output)
+        return [line.decode('utf-8') for line in command_output]
+
+    async def _run_single_int(self, command):
+        """Run a command whose output is a single integer line and return it, 0 when empty."""
+        command_output = await self.run_command(command)
+        return _parse_int(command_output[0] if command_output else '')
+
+    # Commands
+    async def add(self, xyz):
+        """Add XYZ to playlist."""
+        await self.run_command('add ' + xyz)
+
+    async def enqueue(self, xyz):
+        """Queue XYZ to playlist."""
+        await self.run_command('enqueue ' + xyz)
+
+    async def play(self):
+        """Play stream."""
+        await self.run_command('play')
+
+    async def stop(self):
+        """Stop stream."""
+        await self.run_command('stop')
+
+    async def pause(self):
+        """Toggle pause."""
+        await self.run_command('pause')
+
+    async def next(self):
+        """Next playlist item."""
+        await self.run_command('next')
+
+    async def prev(self):
+        """Previous playlist item."""
+        await self.run_command('prev')
+
+    async def goto(self, item):
+        """Goto item at index."""
+        await self.run_command(f'goto {item}')
+
+    async def clear(self):
+        """Clear the playlist."""
+        await self.run_command('clear')
+
+    async def seek(self, time):
+        """Seek in seconds, for instance 'seek 12'."""
+        await self.run_command(f'seek {time}')
+
+    async def status(self):
+        """Current playlist status."""
+        return _parse_status(await self.run_command('status'))
+
+    async def info(self):
+        """Information about the current stream."""
+        return _parse_info(await self.run_command('info'))
+
+    async def get_time(self):
+        """Seconds elapsed since stream's beginning."""
+        return await self._run_single_int('get_time')
+
+    async def is_playing(self):
+        """True if a stream plays, False otherwise."""
+        return (await self.run_command('is_playing'))[0] == '1'
+
+    async def get_title(self):
+        """The title of the current stream."""
+        return (await self.run_command('get_title'))[0]
+
+    async def get_length(self):
+        """The length of the current stream."""
+        return await self._run_single_int('get_length')
+
+    async def set_volume(self, setto):
+        """Set audio volume."""
+        await self.run_command(f'volume {int(setto)}')
+
+    async def volume(self):
+        """Get audio volume (0 to 500)."""
+        return await self._run_single_int('volume')
+
+    async def volup(self, raiseby):
+        """Raise audio volume X steps."""
+        await self.run_command(f'volup {int(raiseby)}')
+
+    async def voldown(self, raiseby):
+        """Lower audio volume X steps."""
+        await self.run_command(f'voldown {int(raiseby)}')
+
+    async def logout(self):
+        """Exit."""
+        await self.run_command('logout')
+
+    async def shutdown(self):
+        """Shutdown VLC."""
+        await self.run_command('shutdown')
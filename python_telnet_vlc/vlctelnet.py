@@ -2,14 +2,30 @@
 
 # Imports
 import logging
-import telnetlib
 import re
+import socket
+from contextlib import contextmanager
 
 # Error Imports
 from socket import error as sockerr
 
 _LOGGER = logging.getLogger(__package__)
 
+
+# Telnet IAC option negotiation, sent by VLC around the password prompt
+_IAC_SEQUENCE = re.compile(rb"\xff[\xfb-\xfe].", re.DOTALL)
+
+# Section header of the info output, capturing its last word
+_INFO_SECTION = re.compile(r"\+----\[ (?:\S+ )*?(\S+) \]")
+# Decimal number in the info output, most values are plain text
+_INFO_FLOAT = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+# Lines of the status output
+_STATUS_INPUT = re.compile(r"^\( new input: (.*) \)$", re.MULTILINE)
+_STATUS_VOLUME = re.compile(r"^\( audio volume: (\d+) \)$", re.MULTILINE)
+_STATUS_STATE = re.compile(r"^\( state (\S+) \)$", re.MULTILINE)
+
+
 # Exceptions
 class VLCProcessError(Exception):
     """Something is wrong with VLC itself."""
@@ -41,76 +57,349 @@ class AuthError(Exception):
     pass
 
 
+# Output parsing
+def _check_output(command_output):
+    """Raise the matching error if VLC did not accept the command.
+       Takes the undecoded output lines."""
+    if command_output:
+        first = command_output[0]
+        if first.startswith(b"Unknown command `") and first.endswith(b"'. Type `help' for help."):
+            raise CommandError("Unknown Command")
+        elif first.startswith(b"Error in"):
+            raise LuaError(first.decode('utf-8'))
+
+
+def _check_password_response(command_output):
+    """Raise the matching error if VLC did not accept the password."""
+    parsed_output = command_output.lower()
+    if "wrong password" in parsed_output:
+        raise AuthError("Failed to login to VLC.")
+    if "welcome" not in parsed_output:
+        raise CommandError(f"Unexpected password response: {command_output}")
+
+
+def _parse_int(line):
+    """Parse an output line holding a single integer, 0 when VLC left it empty."""
+    return int(line) if line else 0
+
+
+def _parse_status(status_output):
+    """Parse the lines of the status output."""
+    status_output = '\n'.join(status_output)
+    # Example: "( new input: file:///path/to/file.mp3 )"
+    input_match = _STATUS_INPUT.search(status_output)
+    volume_match = _STATUS_VOLUME.search(status_output)
+    state_match = _STATUS_STATE.search(status_output)
+    if volume_match is None or state_match is None:
+        raise ParseError("Could not get status.")
+    returndict = {}
+    if input_match is not None:
+        returndict['input'] = input_match.group(1).replace(' ', '%20')
+    returndict['volume'] = int(volume_match.group(1))
+    returndict['state'] = state_match.group(1)
+    return returndict
+
+
+def _parse_info(info_output):
+    """Parse the lines of the info output into a dict of sections."""
+    section = None
+    data = {}
+    for l in info_output:
+        if l[0] == '+':
+            # Example: "+----[ Stream 5 ]" or "+----[ Meta data ]"
+            if 'end of stream info' in l: continue
+            match = _INFO_SECTION.fullmatch(l)
+            if match is None:
+                raise ParseError("Unexpected section in info output")
+            section = match.group(1)
+            if section.isdecimal():
+                section = int(section)
+            data[section] = {}
+        elif l[0] == '|':
+            # Example: "| Description: Closed captions 4"
+            key, _, value = l[2:].partition(':')
+            if not key: continue
+            data[section][key.strip()] = _parse_info_value(value)
+        else:
+            raise ParseError("Unexpected line in info output")
+    return data
+
+
+def _parse_info_value(value):
+    """Convert a value of the info output to int or float when possible."""
+    value = value.strip()
+    digits = value[1:] if value.startswith(('-', '+')) else value
+    if digits.isdecimal():
+        return int(value)
+    # Match first rather than letting float() raise for every text value.
+    if _INFO_FLOAT.fullmatch(value):
+        return float(value)
+    return value
+
+
 # VLC Telnet Class
 class VLCTelnet(object):
     """Conection to VLC using Telnet."""
 
+    # Commands without arguments, encoded once
+    _CMD_PLAY = b'play\n'
+    _CMD_STOP = b'stop\n'
+    _CMD_NEXT = b'next\n'
+    _CMD_PREV = b'prev\n'
+    _CMD_REPEAT = b'repeat\n'
+    _CMD_LOOP = b'loop\n'
+    _CMD_RANDOM = b'random\n'
+    _CMD_CLEAR = b'clear\n'
+    _CMD_TITLE_N = b'title_n\n'
+    _CMD_TITLE_P = b'title_p\n'
+    _CMD_CHAPTER_N = b'chapter_n\n'
+    _CMD_CHAPTER_P = b'chapter_p\n'
+    _CMD_PAUSE = b'pause\n'
+    _CMD_FASTFORWARD = b'fastforward\n'
+    _CMD_REWIND = b'rewind\n'
+    _CMD_FASTER = b'faster\n'
+    _CMD_SLOWER = b'slower\n'
+    _CMD_NORMAL = b'normal\n'
+    _CMD_FRAME = b'frame\n'
+    _CMD_FULLSCREEN = b'f\n'
+    _CMD_SNAPSHOT = b'snapshot\n'
+    _CMD_VLM = b'vlm\n'
+    _CMD_LOGOUT = b'logout\n'
+    _CMD_SHUTDOWN = b'shutdown\n'
+
     # Non commands
-    def __init__(self, host="localhost", password="admin", port=4212, connect=True, login=True):
-        self.tn = telnetlib.Telnet()
+    def __init__(self, host="localhost", password="admin", port=4212, connect=True, login=True, retries=1):
+        self.sock = None
+        self._send = self._recv_into = None
+        # Receive buffer reused for the whole session, only its first _length bytes are data.
+        self._buffer = bytearray(65536)
+        self._length = 0
         self.host = host
         self.port = port
         self.password = password
+        self.autologin = login
+        self.retries = retries
+        self._batch = None
         if connect:
-            self.connect()
-        # Login to VLC using password provided in the arguments
-        if connect and login:
-            self.login()
+            # Login to VLC using password provided in the arguments
+            self._open()
 
     def connect(self):
         """Connect to VLC."""
         # Connect to telnet.
         try:
-            self.tn.open(self.host, port=self.port, timeout=10)
+            self.sock = socket.create_connection((self.host, self.port), timeout=10)
         except sockerr:
             raise ConnectionError("Could not connect to VLC. Make sure the Telnet interface is enabled and accessible.")
+        # Commands are tiny, don't let Nagle hold them back.
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Room for large outputs like info in a single recv.
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 262144)
+        # Bind once, these are used on every command.
+        self._send, self._recv_into = self.sock.sendall, self.sock.recv_into
+        # Drop anything left over from a previous connection.
+        self._length = 0
+
+    def _open(self):
+        """Connect, and login if logging in automatically.
+           Disconnects again if either fails, so no half opened connection is left behind."""
+        try:
+            self.connect()
+            if self.autologin:
+                self.login()
+        except BaseException:
+            self.disconnect()
+            raise
 
     def disconnect(self):
         """Disconnect from VLC."""
-        self.tn.close()
-        # reset the instance
-        self.tn = telnetlib.Telnet()
+        if self.sock is not None:
+            self.sock.close()
+        # Marks the instance as disconnected, the next command connects again.
+        self.sock = None
+        self._send = self._recv_into = None
+
+    def _read_until(self, delim, alternative=None):
+        """Read until delim (or alternative, whichever comes first) is found
+           and return everything up to and including it. If VLC closes the
+           connection first, return what was received, or raise EOFError if nothing."""
+        buffer = self._buffer
+        longest = len(delim) if alternative is None else max(len(delim), len(alternative))
+        start = 0
+        while True:
+            length = self._length
+            index = buffer.find(delim, start, length)
+            found = delim
+            if alternative is not None:
+                alternative_index = buffer.find(alternative, start, length)
+                if alternative_index != -1 and (index == -1 or alternative_index < index):
+                    index, found = alternative_index, alternative
+            if index != -1:
+                end = index + len(found)
+                with memoryview(buffer) as view:
+                    data = bytes(view[:end])
+                    # Move anything received past the delimiter to the front.
+                    if end < length:
+                        view[:length - end] = view[end:length]
+                self._length = length - end
+                return data
+            # The delimiter may straddle the next recv.
+            start = max(0, length - longest + 1)
+            if length == len(buffer):
+                # Output larger than the buffer, grow it.
+                buffer.extend(bytes(len(buffer)))
+            with memoryview(buffer) as view:
+                received = self._recv_into(view[length:])
+            if not received:
+                if length:
+                    # VLC closed the connection after a last output, like on logout.
+                    self._length = 0
+                    return bytes(buffer[:length])
+                raise EOFError("Connection closed by VLC.")
+            self._length = length + received
 
     def login(self):
         """Login with password."""
-        self.tn.read_until(b"Password: ")
-        full_command = self.password.encode('utf-8') + b'\n'
-        self.tn.write(full_command)
-        for _ in range(2):
-            command_output = self.tn.read_until(b'\n', timeout=10).decode('utf-8').strip('\r\n')
-            if command_output:  # discard empty line once.
-                break
+        full_command = (self.password + '\n').encode('utf-8')
+        # Send the password without waiting for the prompt, saving a round trip.
+        self._send(full_command)
+        self._read_until(b"Password: ")
+        # VLC answers with the command prompt, or asks again if the password was wrong.
+        command_output = _IAC_SEQUENCE.sub(b'', self._read_until(b'> ', b"Password: ")).decode('utf-8').strip('\r\n')
         _LOGGER.debug("Password response: %s", command_output)
-        parsed_output = command_output.lower()
-        if "wrong password" in parsed_output:
-            raise AuthError("Failed to login to VLC.")
-        if "welcome" not in parsed_output:
-            raise CommandError("Unexpected password response: {}".format(command_output))
-        if "> " in command_output:
-            return
-        # Read until prompt
-        self.tn.read_until(b'> ')
+        _check_password_response(command_output)
 
     def run_command(self, command):
-        """Run a command and return a list with the output lines."""
+        """Run a command and return a list with the output lines.
+           Inside a batch the command is queued and an empty list is returned."""
         # Put the command in a nice byte-encoded variable
-        full_command = command.encode('utf-8') + b'\n'
-        _LOGGER.debug("Sending command: %s", command)
-        # Write out the command to telnet
-        self.tn.write(full_command)
-        # Get the command output, decode it, and split out the junk
-        command_output = self.tn.read_until(b'> ').decode('utf-8').split('\r\n')[:-1]
-        # Raise command error if VLC does not recognize the command.
+        full_command = (command + '\n').encode('utf-8')
+        if self._batch is not None:
+            self._batch.append(full_command)
+            return []
+        return [line.decode('utf-8') for line in self._retry(self._send_command, full_command)]
+
+    def _output(self, command):
+        """Run a command and return its output lines, for methods that parse them."""
+        self._check_not_batching()
+        return self.run_command(command)
+
+    def _check_not_batching(self):
+        """Raise CommandError when called inside a batch, where outputs are not read back."""
+        if self._batch is not None:
+            raise CommandError("Cannot read the output of a command inside a batch.")
+
+    def _send_literal(self, full_command):
+        """Run an already encoded command, ignoring its output."""
+        if self._batch is not None:
+            self._batch.append(full_command)
+            return
+        self._retry(self._send_command, full_command)
+
+    def _first_line(self, command):
+        """Run a command and return only its first output line, leaving the rest undecoded."""
+        return self._first_line_bytes(command).decode('utf-8')
+
+    def _first_line_bytes(self, command):
+        """Run a command and return its first output line without decoding it,
+           for outputs that are compared or parsed as ASCII anyway."""
+        self._check_not_batching()
+        full_command = (command + '\n').encode('utf-8')
+        return self._retry(self._send_command, full_command)[0]
+
+    @contextmanager
+    def batch(self):
+        """Queue the commands run inside the block and send them all at once when it exits.
+           Methods that return VLC's output raise CommandError inside the block.
+           A batch is sent at most once: if the connection drops while it runs,
+           ConnectionError is raised and the commands are not sent again."""
+        if self._batch is not None:
+            # Already batching, the outer block sends everything.
+            yield
+            return
+        self._batch = []
+        try:
+            yield
+            commands = self._batch
+        finally:
+            self._batch = None
+        if commands:
+            if self.sock is None:
+                self._open()
+            # From here on the batch is being written, so a failure may leave part of it applied.
+            try:
+                self._send_batch(commands)
+            except (sockerr, EOFError):
+                # Part of the batch may already have run, so don't replay it.
+                self.disconnect()
+                raise ConnectionError("Lost connection to VLC during a batch, some of its commands may have run.")
+
+    def _retry(self, send, *args):
+        """Call send, connecting first if disconnected, and reconnecting and retrying
+           up to self.retries times if the connection was lost.
+           A timeout is not retried, as the command may already have run."""
+        for attempt in range(self.retries + 1):
+            if self.sock is None:
+                self._open()
+            try:
+                return send(*args)
+            except socket.timeout:
+                # VLC may still run the command and answer later, so don't send it again,
+                # and drop the connection so that late answer can't be read by the next command.
+                self.disconnect()
+                raise ConnectionError("Timed out waiting for VLC.")
+            except (sockerr, EOFError):
+                # Never leave a half read output behind on the connection.
+                self.disconnect()
+                if attempt == self.retries:
+                    raise ConnectionError("Lost connection to VLC.")
+                _LOGGER.debug("Connection lost, reconnecting to VLC")
+
+    def _run_single_int(self, command):
+        """Run a command whose output is a single integer line and return it, 0 when empty."""
+        self._check_not_batching()
+        full_command = (command + '\n').encode('utf-8')
+        return self._retry(self._send_single_int, full_command)
+
+    def _send_single_int(self, full_command):
+        """Send an encoded command and parse its single line of output as an integer."""
+        _LOGGER.debug("Sending command: %s", full_command)
+        self._send(full_command)
+        data = self._read_until(b'\r\n', b'> ')
+        if data.endswith(b'\r\n'):
+            line = data[:-2]
+            # Drain the rest of the output, up to the prompt
+            self._read_until(b'> ')
+        else:
+            # Only the prompt came back, there is no output line.
+            line = b''
+        _LOGGER.debug("Command output: %s", line)
+        _check_output([line])
+        return _parse_int(line)
+
+    def _send_command(self, full_command):
+        """Send an encoded command and return a list with the undecoded output lines."""
+        _LOGGER.debug("Sending command: %s", full_command)
+        # Write out the command to VLC
+        self._send(full_command)
+        # Get the command output and split out the junk, decoding is left to the caller
+        command_output = self._read_until(b'> ').split(b'\r\n')[:-1]
         _LOGGER.debug("Command output: %s", command_output)
-        if command_output:
-            command_error = re.match(r"Error in.*", command_output[0])
-            if re.match(r"Unknown command `.*'\. Type `help' for help\.", command_output[0]):
-                raise CommandError("Unknown Command")
-            elif command_error:
-                raise LuaError(command_error.group())
+        _check_output(command_output)
         # Return the split output of the command
         return command_output
 
+    def _send_batch(self, commands):
+        """Send several encoded commands in a single write, then read all of their outputs."""
+        full_command = b''.join(commands)
+        _LOGGER.debug("Sending batch: %s", commands)
+        self._send(full_command)
+        # Read every output before checking, so the stream stays in sync on errors.
+        outputs = [self._read_until(b'> ').split(b'\r\n')[:-1] for _ in commands]
+        _LOGGER.debug("Batch output: %s", outputs)
+        for command_output in outputs:
+            _check_output(command_output)
+
     # Commands
     # Block 1
     def add(self, xyz):
@@ -129,42 +418,42 @@ class VLCTelnet(object):
         """Show services discovery or toggle.
            Returns True for enabled and False for Disabled."""
         if service == 'show':
-            return self.run_command('sd')
+            return self._output('sd')
         else:
             command = 'sd ' + service
-            output = self.run_command(command)[0]
-            if 'enabled.' in output:
+            output = self._first_line_bytes(command)
+            if b'enabled.' in output:
                 return True
-            elif 'disabled.' in output:
+            elif b'disabled.' in output:
                 return False
             else:
                 raise ParseError("Could not parse the output of sd.")
 
     def play(self):
         """Play stream."""
-        self.run_command('play')
+        self._send_literal(self._CMD_PLAY)
 
     def stop(self):
         """Stop stream."""
-        self.run_command('stop')
+        self._send_literal(self._CMD_STOP)
 
     def next(self):
         """Next playlist item."""
-        self.run_command('next')
+        self._send_literal(self._CMD_NEXT)
 
     def prev(self):
         """Previous playlist item."""
-        self.run_command('prev')
+        self._send_literal(self._CMD_PREV)
 
     def goto(self, item):
         """Goto item at index."""
-        command = 'goto {}'.format(item)
+        command = f'goto {item}'
         self.run_command(command)
 
     def repeat(self, switch=True, setting='on'):
         """Toggle playlist repeat."""
         if switch:
-            self.run_command('repeat')
+            self._send_literal(self._CMD_REPEAT)
         else:
             command = 'repeat ' + setting
             self.run_command(command)
@@ -172,7 +461,7 @@ class VLCTelnet(object):
     def loop(self, switch=True, setting='on'):
         """Toggle playlist loop."""
         if switch:
-            self.run_command('loop')
+            self._send_literal(self._CMD_LOOP)
         else:
             command = 'loop ' + setting
             self.run_command(command)
@@ -180,30 +469,18 @@ class VLCTelnet(object):
     def random(self, switch=True, setting='on'):
         """Toggle playlist random."""
         if switch:
-            self.run_command('random')
+            self._send_literal(self._CMD_RANDOM)
         else:
             command = 'random ' + setting
             self.run_command(command)
 
     def clear(self):
         """Clear the playlist."""
-        self.run_command('clear')
+        self._send_literal(self._CMD_CLEAR)
 
     def status(self):
         """Current playlist status."""
-        status_output = self.run_command('status')
-        if len(status_output) == 3:
-            inputloc = '%20'.join(status_output[0].split(' ')[3:-1])
-            volume = int(status_output[1].split(' ')[3])
-            state = status_output[2].split(' ')[2]
-            returndict = {'input': inputloc, 'volume': volume, 'state': state}
-        elif len(status_output) == 2:
-            volume = int(status_output[0].split(' ')[3])
-            state = status_output[1].split(' ')[2]
-            returndict = {'volume': volume, 'state': state}
-        else:
-            raise ParseError("Could not get status.")
-        return returndict
+        return _parse_status(self._output('status'))
 
     def set_title(self, setto):
         """Set title in current item."""
@@ -212,15 +489,15 @@ class VLCTelnet(object):
 
     def title(self):
         """Get title in current item."""
-        return self.run_command('title')[0]
+        return self._first_line('title')
 
     def title_n(self):
         """Next title in current item."""
-        self.run_command('title_n')
+        self._send_literal(self._CMD_TITLE_N)
 
     def title_p(self):
         """Previous title in current item."""
-        self.run_command('title_p')
+        self._send_literal(self._CMD_TITLE_P)
 
     def set_chapter(self, setto):
         """Set chapter in current item."""
@@ -229,45 +506,45 @@ class VLCTelnet(object):
 
     def chapter(self):
         """Get chapter in current item."""
-        return self.run_command('chapter')[0]
+        return self._first_line('chapter')
 
     def chapter_n(self):
         """Next chapter in current item."""
-        self.run_command('chapter_n')
+        self._send_literal(self._CMD_CHAPTER_N)
 
     def chapter_p(self):
         """Previous chapter in current item."""
-        self.run_command('chapter_p')
+        self._send_literal(self._CMD_CHAPTER_P)
 
     # Block 2
     def seek(self, time):
         """Seek in seconds, for instance 'seek 12'."""
-        command = 'seek ' + str(time)
+        command = f'seek {time}'
         self.run_command(command)
 
     def pause(self):
         """Toggle pause."""
-        self.run_command('pause')
+        self._send_literal(self._CMD_PAUSE)
 
     def fastforward(self):
         """Set to maximum rate."""
-        self.run_command('fastforward')
+        self._send_literal(self._CMD_FASTFORWARD)
 
     def rewind(self):
         """Set to minimum rate."""
-        self.run_command('rewind')
+        self._send_literal(self._CMD_REWIND)
 
     def faster(self):
         """Faster playing of stream."""
-        self.run_command('faster')
+        self._send_literal(self._CMD_FASTER)
 
     def slower(self):
         """Slower playing of stream."""
-        self.run_command('slower')
+        self._send_literal(self._CMD_SLOWER)
 
     def normal(self):
         """Normal playing of stream."""
-        self.run_command('normal')
+        self._send_literal(self._CMD_NORMAL)
 
     def rate(self, newrate):
         """Set playback rate to value."""
@@ -276,84 +553,56 @@ class VLCTelnet(object):
 
     def frame(self):
         """Play frame by frame."""
-        self.run_command('frame')
+        self._send_literal(self._CMD_FRAME)
 
     def fullscreen(self, switch=True, setting='on'):
         """Toggle fullscreen."""
         if switch:
-            self.run_command('f')
+            self._send_literal(self._CMD_FULLSCREEN)
         else:
             command = 'f ' + setting
             self.run_command(command)
 
     def info(self):
         """Information about the current stream."""
-        section = None
-        data = {}
-        for l in self.run_command('info'):
-            if l[0] == '+':
-                # Example: "+----[ Stream 5 ]" or "+----[ Meta data ]"
-                if 'end of stream info' in l: continue
-                section = l.split('[')[1].replace(']','').strip().split(' ')[1]
-                try:
-                    section = int(section)
-                except ValueError:
-                    pass
-                data[section] = {}
-            elif l[0] == '|':
-                # Example: "| Description: Closed captions 4"
-                if len(l[2:]) == 0: continue
-                key, value = l[2:].split(':',1)
-                try:
-                    value = int(value)
-                except ValueError:
-                    try:
-                        value = float(value)
-                    except ValueError:
-                        value = value.strip()
-                data[section][key.strip()] = value
-            else:
-                raise ParseError("Unexpected line in info output")
-        return data
+        return _parse_info(self._output('info'))
 
     # Skipping stats
     def get_time(self):
         """Seconds elapsed since stream's beginning."""
-        stream_time = self.run_command('get_time')[0]
-        return int(stream_time) if stream_time else 0
+        return self._run_single_int('get_time')
 
     def is_playing(self):
         """True if a stream plays, False otherwise."""
-        command_output = self.run_command('is_playing')[0]
-        return True if command_output == '1' else False
+        command_output = self._first_line_bytes('is_playing')
+        return True if command_output == b'1' else False
 
     def get_title(self):
         """The title of the current stream."""
-        return self.run_command('get_title')[0]
+        return self._first_line('get_title')
 
     def get_length(self):
         """The length of the current stream."""
-        stream_length = self.run_command('get_length')[0]
-        return int(stream_length) if stream_length else 0
+        return self._run_single_int('get_length')
 
     # Block 3
     def set_volume(self, setto):
         """Set audio volume."""
-        command = 'volume {}'.format(int(setto))
+        command = f'volume {int(setto)}'
         self.run_command(command)
 
     def volume(self):
         """Get audio volume (0 to 500)."""
-        return int(self.run_command('volume')[0])
+        return self._run_single_int('volume')
 
     def volup(self, raiseby):
         """Raise audio volume X steps."""
-        command = 'volup {}'.format(int(raiseby))
+        command = f'volup {int(raiseby)}'
         self.run_command(command)
 
     def voldown(self, raiseby):
         """Lower audio volume X steps."""
-        command = 'voldown {}'.format(int(raiseby))
+        command = f'voldown {int(raiseby)}'
         self.run_command(command)
 
     # The following 'get' commands ARE NOT PARSED! Must do later :D
@@ -364,7 +613,7 @@ class VLCTelnet(object):
 
     def adev(self):
         """Get audio device."""
-        return self.run_command('adev')[0]
+        return self._first_line('adev')
 
     def set_achan(self, setto):
         """Set audio channels."""
@@ -373,25 +622,25 @@ class VLCTelnet(object):
 
     def achan(self):
         """Get audio channels."""
-        return self.run_command('achan')[0]
+        return self._first_line('achan')
 
     def set_atrack(self, setto):
         """Set audio track."""
-        command = 'atrack ' + str(setto)
+        command = f'atrack {setto}'
         self.run_command(command)
 
     def atrack(self):
         """Get audio track."""
-        return self.run_command('atrack')[0]
+        return self._first_line('atrack')
 
     def set_vtrack(self, setto):
         """Set video track."""
-        command = 'vtrack ' + str(setto)
+        command = f'vtrack {setto}'
         self.run_command(command)
 
     def vtrack(self):
         """Get video track."""
-        return self.run_command('vtrack')[0]
+        return self._first_line('vtrack')
 
     def set_vratio(self, setto):
         """Set video aspect ratio."""
@@ -400,7 +649,7 @@ class VLCTelnet(object):
 
     def vratio(self):
         """Get video aspect ratio."""
-        return self.run_command('vratio')[0]
+        return self._first_line('vratio')
 
     def set_crop(self, setto):
         """Set video crop."""
@@ -409,7 +658,7 @@ class VLCTelnet(object):
 
     def crop(self):
         """Get video crop."""
-        return self.run_command('crop')[0]
+        return self._first_line('crop')
 
     def set_zoom(self, setto):
         """Set video zoom."""
@@ -418,7 +667,7 @@ class VLCTelnet(object):
 
     def zoom(self):
         """Get video zoom."""
-        return self.run_command('zoom')[0]
+        return self._first_line('zoom')
 
     def set_vdeinterlace(self, setto):
         """Set video deintelace."""
@@ -427,7 +676,7 @@ class VLCTelnet(object):
 
     def vdeinterlace(self):
         """Get video deintelace."""
-        return self.run_command('vdeinterlace')[0]
+        return self._first_line('vdeinterlace')
 
     def set_vdeinterlace_mode(self, setto):
         """Set video deintelace mode."""
@@ -436,11 +685,11 @@ class VLCTelnet(object):
 
     def vdeinterlace_mode(self):
         """Get video deintelace mode."""
-        return self.run_command('vdeinterlace_mode')[0]
+        return self._first_line('vdeinterlace_mode')
 
     def snapshot(self):
         """Take video snapshot."""
-        self.run_command('snapshot')
+        self._send_literal(self._CMD_SNAPSHOT)
 
     def set_strack(self, setto):
         """Set subtitles track."""
@@ -449,17 +698,17 @@ class VLCTelnet(object):
 
     def strack(self):
         """Get subtitles track."""
-        return self.run_command('strack')[0]
+        return self._first_line('strack')
 
     # Block 4 - Skipping a few useless ones when using a library
     def vlm(self):
         """Load the VLM."""
-        self.run_command('vlm')
+        self._send_literal(self._CMD_VLM)
 
     def logout(self):
         """Exit."""
-        self.run_command('logout')
+        self._send_literal(self._CMD_LOGOUT)
 
     def shutdown(self):
         """Shutdown VLC."""
-        self.run_command('shutdown')
+        self._send_literal(self._CMD_SHUTDOWN)
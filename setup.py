@@ -15,6 +15,8 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/rodripf/python-telnet-vlc",
     packages=setuptools.find_packages(),
+    # Plain sockets only, no telnetlib (removed in Python 3.13).
+    python_requires=">=3.7",
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: GNU General Public License v3 (GPLv3)",